@@ -10,21 +10,32 @@ All prompts, country list, and visa-type responses come from conversation.json.
 import json
 import re
 
+try:
+    import orjson  # optional: faster config parsing
+except ImportError:
+    orjson = None
+
 # Path to your Conversation JSON file
 INTENT_JSON = '/content/drive/MyDrive/Chat_bot/Conversation'
 
+_FAREWELL_RE = re.compile(r"\b(bye|goodbye|see you|exit|quit)\b", re.IGNORECASE)
+_AFFIRM_RE = re.compile(r"\b(yes|yep|yeah|sure|of course)\b", re.IGNORECASE)
+_OPTION_RE = re.compile(r"\boption")  # 'options', 'what option' but not 'adoption'
+
 class ChatCLI:
     def __init__(self) -> None:
         # Load entire config
-        with open(INTENT_JSON, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        with open(INTENT_JSON, 'rb') as f:
+            raw = f.read()
+        config = orjson.loads(raw) if orjson else json.loads(raw)
         # Prompts
         self.prompts = config.get('prompts', {})
-        # Country visa mapping
-        self.country_map = {
-            c['name'].strip().lower(): c['visa_required']
-            for c in config.get('country_check', {}).get('countries', [])
-        }
+        # Known countries, and the subset that needs a visa
+        countries = config.get('country_check', {}).get('countries', [])
+        self.countries = frozenset(c['name'].strip().lower() for c in countries)
+        self.visa_required = frozenset(
+            c['name'].strip().lower() for c in countries if c['visa_required']
+        )
         # Visa type responses map (keys are original titles)
         self.visa_types = config.get('visa_types', {})
         # Lowercase lookup map for visa types
@@ -33,55 +44,59 @@ class ChatCLI:
         self.opts = ', '.join(self.prompts.get('visa_type_options', list(self.visa_types.keys())))
         # Conversation state
         self.state = 'ASK_COUNTRY'
+        # State -> handler returning (next_state, reply)
+        self._handlers = {
+            'ASK_COUNTRY': self._handle_country,
+            'ASK_VISA_TYPE': self._handle_visa_type,
+            'END': self._handle_end,
+        }
 
     def respond(self, user_input: str) -> str:
         text = user_input.strip()
         key = text.lower()
         # Farewell at any time
-        if re.search(r"\b(bye|goodbye|see you|exit|quit)\b", text, re.IGNORECASE):
+        if _FAREWELL_RE.search(text):
             return self.prompts.get('goodbye', 'Thank you—hope I helped. Goodbye!')
+        handler = self._handlers.get(self.state)
+        if handler is None:
+            # Fallback default
+            return self.prompts.get('fallback_country', 'Sorry, I didn\'t understand that.')
+        self.state, reply = handler(text, key)
+        return reply
+
+    def _handle_country(self, text: str, key: str) -> tuple[str, str]:
         # State: ask country
-        if self.state == 'ASK_COUNTRY':
-            if key in self.country_map:
-                if not self.country_map[key]:
-                    self.state = 'END'
-                    return (
-                        "Excellent, you do not need a visa to visit Nigeria. "
-                        + self.prompts.get('ask_more', '')
-                    )
-                else:
-                    self.state = 'ASK_VISA_TYPE'
-                    return self.prompts.get(
-                        'ask_visa_type',
-                        f"Great! You need a visa to visit Nigeria. Which visa type are you interested in? ({self.opts})"
-                    )
-            # unrecognized country
-            return self.prompts.get('fallback_country', 'Sorry, I didn\'t recognize that country. Please try again.')
+        if key in self.countries:
+            if key not in self.visa_required:
+                return 'END', (
+                    "Excellent, you do not need a visa to visit Nigeria. "
+                    + self.prompts.get('ask_more', '')
+                )
+            return 'ASK_VISA_TYPE', self.prompts.get(
+                'ask_visa_type',
+                f"Great! You need a visa to visit Nigeria. Which visa type are you interested in? ({self.opts})"
+            )
+        # unrecognized country
+        return 'ASK_COUNTRY', self.prompts.get('fallback_country', 'Sorry, I didn\'t recognize that country. Please try again.')
 
+    def _handle_visa_type(self, text: str, key: str) -> tuple[str, str]:
         # State: ask visa type
-        if self.state == 'ASK_VISA_TYPE':
-            vt_key = text.lower()
-            # if user asks options
-            if 'option' in vt_key:
-                return f"Available visa types: {self.opts}"
-            details = self.visa_type_map.get(vt_key)
-            self.state = 'END'
-            if details:
-                return details['response'] + "\n" + self.prompts.get('ask_more', '')
-            return self.prompts.get(
-                'fallback_visa_type',
-                f"Sorry, I don't have details for '{text}'. Options: {self.opts}."
-            )
+        # if user asks options
+        if _OPTION_RE.search(key):
+            return 'ASK_VISA_TYPE', f"Available visa types: {self.opts}"
+        details = self.visa_type_map.get(key)
+        if details:
+            return 'END', details['response'] + "\n" + self.prompts.get('ask_more', '')
+        return 'END', self.prompts.get(
+            'fallback_visa_type',
+            f"Sorry, I don't have details for '{text}'. Options: {self.opts}."
+        )
 
+    def _handle_end(self, text: str, key: str) -> tuple[str, str]:
         # State: end/follow-up
-        if self.state == 'END':
-            if re.search(r"\b(yes|yep|yeah|sure|of course)\b", text, re.IGNORECASE):
-                self.state = 'ASK_COUNTRY'
-                return self.prompts.get('ask_country', "Please tell me which country you're from.")
-            return self.prompts.get('goodbye', 'Thank you—hope I helped. Goodbye!')
-
-        # Fallback default
-        return self.prompts.get('fallback_country', 'Sorry, I didn\'t understand that.')
+        if _AFFIRM_RE.search(text):
+            return 'ASK_COUNTRY', self.prompts.get('ask_country', "Please tell me which country you're from.")
+        return 'END', self.prompts.get('goodbye', 'Thank you—hope I helped. Goodbye!')
 
     def chat(self) -> None:
         # Start conversation
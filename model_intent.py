@@ -3,6 +3,7 @@ Train and serialize a Naive Bayes classifier for visa intents.
 """
 import pickle
 from typing import List
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.pipeline import Pipeline
@@ -18,7 +19,10 @@ class VisaIntentModel:
         self.pipeline.fit(texts, labels)
 
     def predict(self, text: str) -> str:
-        return self.pipeline.predict([text])[0]
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: List[str]) -> np.ndarray:
+        return self.pipeline.predict(texts)
 
     def save(self, path: str):
         with open(path, 'wb') as f:
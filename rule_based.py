@@ -3,11 +3,13 @@ Simple rule-based handlers for greetings and farewells.
 """
 import re
 
+_GREETING_RE = re.compile(r"\b(hi|hello)\b|how are you|good day", re.IGNORECASE)
+_FAREWELL_RE = re.compile(r"\bbye\b|see you|goodbye", re.IGNORECASE)
+
+
 def is_greeting(text: str) -> bool:
-    patterns = [r"\bhi\b", r"\bhello\b", r"how are you", r"good day"]
-    return any(re.search(pat, text, re.IGNORECASE) for pat in patterns)
+    return _GREETING_RE.search(text) is not None
 
 
 def is_farewell(text: str) -> bool:
-    patterns = [r"\bbye\b", r"see you", r"goodbye"]
-    return any(re.search(pat, text, re.IGNORECASE) for pat in patterns)
+    return _FAREWELL_RE.search(text) is not None
@@ -1,29 +1,51 @@
 import json
 import os
 import re
-import time
-from collections import Counter
+from collections import Counter, namedtuple
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import streamlit as st
 
+# Must run before any other st.* call, including the cache spinners below
+st.set_page_config(page_title="Nigeria Immigration Chatbot", layout="wide")
+
+try:
+    import orjson  # optional: faster config parsing
+except ImportError:
+    orjson = None
+
 # ===================== Config / constants =====================
-APP_VERSION = "ui-v4"  # bump to force a state reset if needed
+APP_VERSION = "ui-v5"  # bump to force a state reset if needed
 BASE_DIR = Path(__file__).parent
 CONFIG_PATH = BASE_DIR / "Conversation"  # Capital C, no extension
 
-with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-    config = json.load(f)
-
 cfg_stat = os.stat(CONFIG_PATH)
 SESSION_KEY = f"{APP_VERSION}:{int(cfg_stat.st_mtime)}:{cfg_stat.st_size}"
 
+@st.cache_data
+def load_config(mtime: float, size: int) -> dict:
+    """Parse the Conversation file; mtime/size key the cache so edits are picked up."""
+    raw = CONFIG_PATH.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+config = load_config(cfg_stat.st_mtime, cfg_stat.st_size)
+
+# ===================== Compiled patterns =====================
+_CANON_RE = re.compile(r"[\s_-]+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+# Same character class for ASCII as a translate table (C-level, no regex engine)
+_PUNCT_TABLE = str.maketrans({chr(i): " " for i in range(128) if _PUNCT_RE.match(chr(i))})
+_DUP_PAREN_RE = re.compile(r"\)\s*\([^()]*\)\s*$")
+
 # ===================== Small helpers =====================
+@lru_cache(maxsize=512)
 def canon(s: str) -> str:
     """Canonicalize for keys: lower + strip spaces/underscores/hyphens."""
-    return re.sub(r"[\s_-]+", "", s.strip().lower())
+    return _CANON_RE.sub("", s.strip().lower())
 
+@lru_cache(maxsize=256)
 def pretty(label: str) -> str:
     """Human-friendly label for display."""
     if canon(label) == "visaonarrival":
@@ -31,66 +53,161 @@ def pretty(label: str) -> str:
     cleaned = label.replace("_", " ").replace("-", " ").strip()
     return cleaned if any(ch.isupper() for ch in cleaned) else cleaned.title()
 
-def is_farewell(text: str) -> bool:
-    return re.search(r"\b(bye|goodbye|see you|exit|quit)\b", text, re.IGNORECASE) is not None
-
-def is_greeting(text: str) -> bool:
-    return re.search(r"\b(hi|hello|hey|good day)\b", text, re.IGNORECASE) is not None
-
-def is_thanks(text: str) -> bool:
-    return re.search(r"\b(thanks?|thank\s*you)\b", text, re.IGNORECASE) is not None
-
-def match_country(text: str, countries: dict) -> str | None:
-    """Find a country as a whole word; tolerant of punctuation like 'Iran?' or 'Iraq,'."""
-    low = re.sub(r"[^\w\s]", " ", text.lower())  # strip punctuation to spaces
-    for c in countries.keys():
-        if re.search(rf"\b{re.escape(c)}\b", low):
-            return c
-    return None
-
-def resolve_visa_type(user_text: str, visa_types: dict, display_options: list[str]) -> str | None:
+def resolve_visa_type(user_text: str, matcher: re.Pattern, aliases: dict | None = None) -> str | None:
     """
     Robust resolver: accepts 'tourist', 'tourist visa', 'visa-on-arrival', etc.
-    Returns canonical key from visa_types or None.
+    matcher is an alternation over the canonical visa-type keys and display options;
+    aliases is an optional precomputed {canonical text: result} map tried first.
+    Returns the first (leftmost) key found in the text, or None.
     """
     vt = canon(user_text)
-    if vt in visa_types:
-        return vt
-    for k in visa_types.keys():
-        if vt.startswith(k) or k in vt:
-            return k
-    for disp in display_options:
-        dkey = canon(disp)
-        if vt == dkey or vt.startswith(dkey) or dkey in vt:
-            return dkey
-    return None
+    if aliases and vt in aliases:
+        return aliases[vt]
+    m = matcher.search(vt)
+    return m.group(0) if m else None
+
+def strip_punct(text: str) -> str:
+    """Replace punctuation with spaces; regex only for the rare non-ASCII message."""
+    return text.translate(_PUNCT_TABLE) if text.isascii() else _PUNCT_RE.sub(" ", text)
+
+def _trie_insert(trie: dict, phrase: str, payload: tuple[str, str]) -> None:
+    """Insert a phrase word by word; the None key marks a complete phrase."""
+    node = trie
+    for word in strip_punct(phrase).split():
+        node = node.setdefault(word, {})
+    node[None] = payload
+
+def scan_message(text: str) -> tuple[set[str], str | None]:
+    """
+    Scan the message once; tolerant of punctuation like 'Iran?' or 'Iraq,'.
+    Returns the intents seen ('thanks', 'farewell', 'greeting') and the first country mentioned.
+    Longest phrase wins, so "Guinea-Bissau" is not cut short by "Guinea".
+    """
+    words = strip_punct(text.lower()).split()  # strip punctuation to spaces
+    intents, country = set(), None
+    i = 0
+    while i < len(words):
+        node, hit, end = data.phrase_trie, None, i + 1
+        for j in range(i, len(words)):
+            node = node.get(words[j])
+            if node is None:
+                break
+            if None in node:
+                hit, end = node[None], j + 1
+        if hit:
+            kind, value = hit
+            if kind == "country":
+                country = country or value
+            else:
+                intents.add(value)
+        i = end
+    return intents, country
 
 # ===================== Data maps from JSON =====================
-country_map = {
-    c["name"].strip().lower(): bool(c["visa_required"])
-    for c in config["country_check"]["countries"]
+# Intent phrases; merged with the country names into the phrase trie
+_INTENT_PHRASES = {
+    "thanks": ("thank", "thanks", "thankyou", "thank you"),
+    "farewell": ("bye", "goodbye", "see you", "exit", "quit"),
+    "greeting": ("hi", "hello", "hey", "good day"),
 }
 
-visa_types_raw = config.get("visa_types", {})
-visa_types = {canon(k): v for k, v in visa_types_raw.items()}
+AppData = namedtuple(
+    "AppData",
+    "countries visa_required country_titles phrase_trie visa_free_countries"
+    " visa_required_countries visa_types display_options visa_type_re"
+    " visa_type_aliases options_str_display ask_visa_type_msg"
+    " welcome_history",
+)
+
+@st.cache_resource
+def build_data(mtime: float, size: int) -> AppData:
+    """Derive every lookup structure from the config once per Conversation file version."""
+    cfg = load_config(mtime, size)
+    # Known countries, and the subset that needs a visa
+    country_list = cfg["country_check"]["countries"]
+    countries = frozenset(c["name"].strip().lower() for c in country_list)
+    visa_required = frozenset(c["name"].strip().lower() for c in country_list if c["visa_required"])
+
+    # Word trie over every phrase we look for: one left-to-right pass finds intents + country
+    phrase_trie = {}
+    for kind, phrases in _INTENT_PHRASES.items():
+        for phrase in phrases:
+            _trie_insert(phrase_trie, phrase, ("intent", kind))
+    for c in countries:
+        _trie_insert(phrase_trie, c, ("country", c))
+
+    # Display names, title-cased once
+    country_titles = {c: c.title() for c in countries}
+
+    # Sidebar lists
+    visa_free_countries = sorted(country_titles[c] for c in countries - visa_required)
+    visa_required_countries = sorted(country_titles[c] for c in visa_required)
+
+    visa_types_raw = cfg.get("visa_types", {})
+    visa_types = {canon(k): v for k, v in visa_types_raw.items()}
+
+    # Build one pretty, de-duplicated options list from prompts + schema
+    prompt_opts = [pretty(x) for x in cfg.get("prompts", {}).get("visa_type_options", [])]
+    schema_opts = [pretty(k) for k in visa_types_raw.keys()]
+    seen, friendly_options = set(), []
+    for opt in prompt_opts + schema_opts:
+        key = canon(opt)
+        if key not in seen:
+            seen.add(key)
+            friendly_options.append(opt)
+
+    # Show chips WITHOUT "General"
+    display_options = [o for o in friendly_options if canon(o) != "general"]
+    display_keys = [canon(o) for o in display_options]
+    options_str_display = ", ".join(display_options)
+
+    # One pass over the canonical text finds every known visa type in it; longest first
+    # so a key that contains another still wins at the same position
+    visa_type_keys = set(visa_types) | set(display_keys)
+    visa_type_re = re.compile(
+        "|".join(re.escape(k) for k in sorted(visa_type_keys, key=len, reverse=True)) or "(?!)"
+    )
+    # Fast path for the usual answers ("tourist", "Tourist visa", chip labels);
+    # values come from the full resolver so the result is identical
+    alias_candidates = visa_type_keys | {f"{k}visa" for k in visa_type_keys}
+    visa_type_aliases = {a: resolve_visa_type(a, visa_type_re) for a in alias_candidates}
+
+    # Visa-type question with the options list filled in
+    ask_tmpl = cfg.get("prompts", {}).get(
+        "ask_visa_type",
+        "Great! You need a visa to visit Nigeria. Which visa type are you interested in?"
+    )
+    if "{visa_type_options}" in ask_tmpl:
+        ask_visa_type_msg = ask_tmpl.format(visa_type_options=options_str_display)
+    else:
+        ask_visa_type_msg = f"{ask_tmpl} ({options_str_display})"
+    ask_visa_type_msg = _DUP_PAREN_RE.sub(")", ask_visa_type_msg)  # drop accidental duplicate list
+
+    # Opening bubbles of every fresh chat
+    welcome_history = (
+        ("Bot", cfg["prompts"]["welcome"]),
+        ("Bot", cfg["prompts"]["ask_country"]),
+    )
 
-# Build one pretty, de-duplicated options list from prompts + schema
-prompt_opts = [pretty(x) for x in config.get("prompts", {}).get("visa_type_options", [])]
-schema_opts = [pretty(k) for k in visa_types_raw.keys()]
-seen, friendly_options = set(), []
-for opt in prompt_opts + schema_opts:
-    key = canon(opt)
-    if key not in seen:
-        seen.add(key)
-        friendly_options.append(opt)
+    return AppData(
+        countries=countries,
+        visa_required=visa_required,
+        country_titles=country_titles,
+        phrase_trie=phrase_trie,
+        visa_free_countries=visa_free_countries,
+        visa_required_countries=visa_required_countries,
+        visa_types=visa_types,
+        display_options=display_options,
+        visa_type_re=visa_type_re,
+        visa_type_aliases=visa_type_aliases,
+        options_str_display=options_str_display,
+        ask_visa_type_msg=ask_visa_type_msg,
+        welcome_history=welcome_history,
+    )
 
-# Show chips WITHOUT "General"
-display_options = [o for o in friendly_options if canon(o) != "general"]
-options_str_display = ", ".join(display_options)
+data = build_data(cfg_stat.st_mtime, cfg_stat.st_size)
 
 # ===================== Page chrome & CSS =====================
-st.set_page_config(page_title="Nigeria Immigration Chatbot", layout="wide")
-
 st.markdown("""
 <style>
 .block-container {max-width: 920px; margin: auto;}
@@ -106,10 +223,7 @@ st.caption(f"Demo • Data last updated: {last_updated}")
 
 # ===================== Session state bootstrap =====================
 def seed_welcome():
-    return [
-        ("Bot", config["prompts"]["welcome"]),
-        ("Bot", config["prompts"]["ask_country"]),
-    ]
+    return list(data.welcome_history)
 
 def reset_chat():
     st.session_state.state = "ASK_COUNTRY"
@@ -117,7 +231,7 @@ def reset_chat():
     st.session_state.current_country = None
     st.session_state.session_key = SESSION_KEY
     st.session_state.last_downloadable = ""  # last long answer for download
-    st.session_state.analytics = {"countries": [], "visa_required": 0, "visa_free": 0}
+    st.session_state.analytics = {"counter": Counter(), "visa_required": 0, "visa_free": 0}
     st.session_state["_focus_composer"] = True  # focus input after reset
 
 # defaults
@@ -126,7 +240,7 @@ st.session_state.setdefault("history", [])
 st.session_state.setdefault("current_country", None)
 st.session_state.setdefault("session_key", SESSION_KEY)
 st.session_state.setdefault("last_downloadable", "")
-st.session_state.setdefault("analytics", {"countries": [], "visa_required": 0, "visa_free": 0})
+st.session_state.setdefault("analytics", {"counter": Counter(), "visa_required": 0, "visa_free": 0})
 st.session_state.setdefault("_focus_composer", False)
 
 # Reset only if data file changed or first run
@@ -134,15 +248,18 @@ if st.session_state.session_key != SESSION_KEY or not st.session_state.history:
     reset_chat()
 
 # Guard: ensure fresh chat starts with welcome
-expected = seed_welcome()
-if st.session_state.state == "ASK_COUNTRY" and (len(st.session_state.history) < 2 or st.session_state.history[:2] != expected):
-    st.session_state.history = expected
+if st.session_state.state == "ASK_COUNTRY" and tuple(st.session_state.history[:2]) != data.welcome_history:
+    st.session_state.history = seed_welcome()
 
-# ===================== Sidebar (tabs) =====================
+# ===================== Sidebar (views) =====================
+# A radio instead of st.tabs: tabs render every body on each rerun, this only the open one
 with st.sidebar:
-    tabs = st.tabs(["Admin", "Countries", "Analytics"])
+    view = st.radio(
+        "View", ["Admin", "Countries", "Analytics"],
+        horizontal=True, label_visibility="collapsed", key="sidebar_view",
+    )
 
-    with tabs[0]:
+    if view == "Admin":
         st.subheader("Admin")
         if st.button("🗑️ New chat"):
             reset_chat()
@@ -150,21 +267,19 @@ with st.sidebar:
         st.write("History persists across refresh. Data updates reset automatically.")
         st.write(f"App version: `{APP_VERSION}`")
 
-    with tabs[1]:
+    elif view == "Countries":
         st.subheader("Visa-free countries")
-        visa_free = sorted([c.title() for c, req in country_map.items() if not req])
-        st.write(visa_free)
+        st.write(data.visa_free_countries)
         st.subheader("Visa-required countries")
-        visa_req = sorted([c.title() for c, req in country_map.items() if req])
-        st.write(visa_req)
+        st.write(data.visa_required_countries)
 
-    with tabs[2]:
+    elif view == "Analytics":
         st.subheader("Session analytics (demo)")
-        asked = st.session_state.analytics["countries"]
+        asked = st.session_state.analytics["counter"]
         if asked:
-            top = Counter(asked).most_common(10)
+            top = asked.most_common(10)
             st.write("**Top countries asked:**")
-            st.write([f"{c.title()} ({n})" for c, n in top])
+            st.write([f"{data.country_titles[c]} ({n})" for c, n in top])
         colA, colB = st.columns(2)
         colA.metric("Visa-free answers", st.session_state.analytics["visa_free"])
         colB.metric("Visa-required answers", st.session_state.analytics["visa_required"])
@@ -178,9 +293,9 @@ for who, msg in st.session_state.history:
 # ===================== Quick-reply chips (direct handler + autofocus) =====================
 if st.session_state.state == "ASK_VISA_TYPE":
     st.markdown("**Choose a visa type:**")
-    cols = st.columns(min(4, len(display_options)))
+    cols = st.columns(min(4, len(data.display_options)))
     chip_clicked = None
-    for i, label in enumerate(display_options):
+    for i, label in enumerate(data.display_options):
         if cols[i % len(cols)].button(label, key=f"vt_btn_{i}"):
             chip_clicked = label
             break
@@ -189,9 +304,9 @@ if st.session_state.state == "ASK_VISA_TYPE":
         # Show user bubble
         st.session_state.history.append(("You", chip_clicked))
         # Resolve + answer directly (no round-trip through text handler)
-        vt_key = resolve_visa_type(chip_clicked, visa_types, display_options)
-        details = visa_types.get(vt_key) if vt_key else None
-        general = visa_types.get("general")
+        vt_key = resolve_visa_type(chip_clicked, data.visa_type_re, data.visa_type_aliases)
+        details = data.visa_types.get(vt_key) if vt_key else None
+        general = data.visa_types.get("general")
         country_disp = st.session_state.get("current_country", "your country")
 
         if details:
@@ -207,7 +322,7 @@ if st.session_state.state == "ASK_VISA_TYPE":
                 "Bot",
                 config["prompts"].get(
                     "fallback_visa_type",
-                    f"Sorry, I don't have details for '{chip_clicked}'. Options: {options_str_display}."
+                    f"Sorry, I don't have details for '{chip_clicked}'. Options: {data.options_str_display}."
                 )
             ))
         # focus composer on next run
@@ -243,128 +358,108 @@ if incoming_text:
     text = incoming_text
     key = text.lower()
     st.session_state.history.append(("You", text))
-
-    with st.spinner("Thinking…"):
-        time.sleep(0.2)
-
-        # A) Global: THANK YOU (keep conversation open)
-        if is_thanks(text):
-            st.session_state.history.append(("Bot", "You're welcome! Have an amazing time in Nigeria!"))
-            st.session_state.state = "END"
-
-        # B) Global: Farewell
-        elif is_farewell(text):
-            st.session_state.history.append(("Bot", config["prompts"]["goodbye"]))
-            st.session_state.state = "END"
-
-        # C) Country check (works at start AND after END). Parse "how about iran".
-        elif st.session_state.state in ("ASK_COUNTRY", "END"):
-            if is_greeting(text):
-                st.session_state.history.append(("Bot", config["prompts"]["ask_country"]))
-                st.session_state.state = "ASK_COUNTRY"
-            else:
-                found = key if key in country_map else match_country(text, country_map)
-                if found:
-                    country_disp = found.title()
-                    st.session_state.current_country = country_disp
-                    st.session_state.analytics["countries"].append(found)
-
-                    if not country_map[found]:
-                        vf = config["prompts"].get(
-                            "visa_free_msg",
-                            "Excellent—you do not need a visa to visit Nigeria."
-                        )
-                        st.session_state.history.append(("Bot", f"For {country_disp}, {vf}"))
-                        st.session_state.analytics["visa_free"] += 1
-                        st.session_state.state = "END"
-                    else:
-                        ask_tmpl = config["prompts"].get(
-                            "ask_visa_type",
-                            "Great! You need a visa to visit Nigeria. Which visa type are you interested in?"
-                        )
-                        if "{visa_type_options}" in ask_tmpl:
-                            ask = ask_tmpl.format(visa_type_options=options_str_display)
-                        else:
-                            ask = f"{ask_tmpl} ({options_str_display})"
-                        ask = re.sub(r"\)\s*\([^()]*\)\s*$", ")", ask)  # drop accidental duplicate list
-                        ask = f"For {country_disp}, {ask}"
-                        st.session_state.history.append(("Bot", ask))
-                        st.session_state.analytics["visa_required"] += 1
-                        st.session_state.state = "ASK_VISA_TYPE"
-                else:
-                    st.session_state.history.append((
-                        "Bot",
-                        config["prompts"].get(
-                            "fallback_country",
-                            "Sorry, I didn't recognize that country. Please tell me which country you're from."
-                        )
-                    ))
-                    st.session_state.state = "ASK_COUNTRY"
-
-        # D) Visa-type follow-up (typed input path) with country-switch + same-country nudge
-        elif st.session_state.state == "ASK_VISA_TYPE":
-            # 1) Allow the user to change country mid-flow (and nudge if it's the same one)
-            new_found = (key if key in country_map else match_country(text, country_map))
-            if new_found:
-                current_disp = st.session_state.get("current_country") or ""
-                if canon(new_found) == canon(current_disp):
-                    st.session_state.history.append((
-                        "Bot",
-                        f"We're already discussing **{current_disp}**. "
-                        f"Please choose a visa type ({options_str_display}) or ask about another country."
-                    ))
-                    # Stay in ASK_VISA_TYPE
+    intents, mentioned = scan_message(text)
+
+    # A) Global: THANK YOU (keep conversation open)
+    if "thanks" in intents:
+        st.session_state.history.append(("Bot", "You're welcome! Have an amazing time in Nigeria!"))
+        st.session_state.state = "END"
+
+    # B) Global: Farewell
+    elif "farewell" in intents:
+        st.session_state.history.append(("Bot", config["prompts"]["goodbye"]))
+        st.session_state.state = "END"
+
+    # C) Country check (works at start AND after END). Parse "how about iran".
+    elif st.session_state.state in ("ASK_COUNTRY", "END"):
+        if "greeting" in intents:
+            st.session_state.history.append(("Bot", config["prompts"]["ask_country"]))
+            st.session_state.state = "ASK_COUNTRY"
+        else:
+            found = key if key in data.countries else mentioned
+            if found:
+                country_disp = data.country_titles[found]
+                st.session_state.current_country = country_disp
+                st.session_state.analytics["counter"][found] += 1
+
+                if found not in data.visa_required:
+                    vf = config["prompts"].get(
+                        "visa_free_msg",
+                        "Excellent—you do not need a visa to visit Nigeria."
+                    )
+                    st.session_state.history.append(("Bot", f"For {country_disp}, {vf}"))
+                    st.session_state.analytics["visa_free"] += 1
+                    st.session_state.state = "END"
                 else:
-                    country_disp = new_found.title()
-                    st.session_state.current_country = country_disp
-                    st.session_state.analytics["countries"].append(new_found)
-
-                    if not country_map[new_found]:
-                        vf = config["prompts"].get(
-                            "visa_free_msg",
-                            "Excellent—you do not need a visa to visit Nigeria."
-                        )
-                        st.session_state.history.append(("Bot", f"For {country_disp}, {vf}"))
-                        st.session_state.analytics["visa_free"] += 1
-                        st.session_state.state = "END"
-                    else:
-                        ask_tmpl = config["prompts"].get(
-                            "ask_visa_type",
-                            "Great! You need a visa to visit Nigeria. Which visa type are you interested in?"
-                        )
-                        if "{visa_type_options}" in ask_tmpl:
-                            ask = ask_tmpl.format(visa_type_options=options_str_display)
-                        else:
-                            ask = f"{ask_tmpl} ({options_str_display})"
-                        ask = re.sub(r"\)\s*\([^()]*\)\s*$", ")", ask)  # drop accidental duplicate list
-                        ask = f"For {country_disp}, {ask}"
-                        st.session_state.history.append(("Bot", ask))
-                        st.session_state.analytics["visa_required"] += 1
-                        st.session_state.state = "ASK_VISA_TYPE"
+                    ask = f"For {country_disp}, {data.ask_visa_type_msg}"
+                    st.session_state.history.append(("Bot", ask))
+                    st.session_state.analytics["visa_required"] += 1
+                    st.session_state.state = "ASK_VISA_TYPE"
+            else:
+                st.session_state.history.append((
+                    "Bot",
+                    config["prompts"].get(
+                        "fallback_country",
+                        "Sorry, I didn't recognize that country. Please tell me which country you're from."
+                    )
+                ))
+                st.session_state.state = "ASK_COUNTRY"
 
+    # D) Visa-type follow-up (typed input path) with country-switch + same-country nudge
+    elif st.session_state.state == "ASK_VISA_TYPE":
+        # 1) Allow the user to change country mid-flow (and nudge if it's the same one)
+        new_found = key if key in data.countries else mentioned
+        if new_found:
+            current_disp = st.session_state.get("current_country") or ""
+            if canon(new_found) == canon(current_disp):
+                st.session_state.history.append((
+                    "Bot",
+                    f"We're already discussing **{current_disp}**. "
+                    f"Please choose a visa type ({data.options_str_display}) or ask about another country."
+                ))
+                # Stay in ASK_VISA_TYPE
             else:
-                # 2) Treat input as a visa-type choice
-                vt_key = resolve_visa_type(text, visa_types, display_options)
-                details = visa_types.get(vt_key) if vt_key else None
-                general = visa_types.get("general")
-                country_disp = st.session_state.get("current_country", "your country")
-
-                if details:
-                    header = f"**For {country_disp} — here are the requirements:**\n"
-                    general_md = f"##### General requirements\n{general['response']}" if general and general.get("response") else ""
-                    specific_md = f"\n\n##### {pretty(vt_key)} visa\n{details['response']}" if details.get("response") else ""
-                    reply = header + general_md + specific_md if (general_md or specific_md) else f"For {country_disp}, no details available."
-                    st.session_state.history.append(("Bot", reply))
-                    st.session_state.last_downloadable = reply
+                country_disp = data.country_titles[new_found]
+                st.session_state.current_country = country_disp
+                st.session_state.analytics["counter"][new_found] += 1
+
+                if new_found not in data.visa_required:
+                    vf = config["prompts"].get(
+                        "visa_free_msg",
+                        "Excellent—you do not need a visa to visit Nigeria."
+                    )
+                    st.session_state.history.append(("Bot", f"For {country_disp}, {vf}"))
+                    st.session_state.analytics["visa_free"] += 1
                     st.session_state.state = "END"
                 else:
-                    st.session_state.history.append((
-                        "Bot",
-                        config["prompts"].get(
-                            "fallback_visa_type",
-                            f"Sorry, I don't have details for '{text}'. Options: {options_str_display}."
-                        )
-                    ))
+                    ask = f"For {country_disp}, {data.ask_visa_type_msg}"
+                    st.session_state.history.append(("Bot", ask))
+                    st.session_state.analytics["visa_required"] += 1
+                    st.session_state.state = "ASK_VISA_TYPE"
+
+        else:
+            # 2) Treat input as a visa-type choice
+            vt_key = resolve_visa_type(text, data.visa_type_re, data.visa_type_aliases)
+            details = data.visa_types.get(vt_key) if vt_key else None
+            general = data.visa_types.get("general")
+            country_disp = st.session_state.get("current_country", "your country")
+
+            if details:
+                header = f"**For {country_disp} — here are the requirements:**\n"
+                general_md = f"##### General requirements\n{general['response']}" if general and general.get("response") else ""
+                specific_md = f"\n\n##### {pretty(vt_key)} visa\n{details['response']}" if details.get("response") else ""
+                reply = header + general_md + specific_md if (general_md or specific_md) else f"For {country_disp}, no details available."
+                st.session_state.history.append(("Bot", reply))
+                st.session_state.last_downloadable = reply
+                st.session_state.state = "END"
+            else:
+                st.session_state.history.append((
+                    "Bot",
+                    config["prompts"].get(
+                        "fallback_visa_type",
+                        f"Sorry, I don't have details for '{text}'. Options: {data.options_str_display}."
+                    )
+                ))
 
 # ===================== Utilities under composer =====================
 if st.session_state.last_downloadable: